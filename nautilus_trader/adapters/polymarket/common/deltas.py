@@ -13,7 +13,6 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from nautilus_trader.model.book import BookLevel
 from nautilus_trader.model.book import OrderBook
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
@@ -26,19 +25,23 @@ from nautilus_trader.model.objects import Price
 
 
 def compute_effective_deltas(
-    book_old: OrderBook,
-    book_new: OrderBook,
+    old_bids: dict[Price, float],
+    old_asks: dict[Price, float],
+    book: OrderBook,
     instrument: BinaryOption,
 ) -> OrderBookDeltas | None:
     """
-    Compare the old and new order book states and generate a list of effective deltas.
+    Compare the previous book levels with the updated book state and generate a list of
+    effective deltas.
 
     Parameters
     ----------
-    book_old : OrderBook
-        The previous state of the order book.
-    book_new : OrderBook
-        The new state of the order book after applying deltas.
+    old_bids : dict[Price, float]
+        The bid sizes per price level prior to applying the update.
+    old_asks : dict[Price, float]
+        The ask sizes per price level prior to applying the update.
+    book : OrderBook
+        The order book state after applying the update.
     instrument : BinaryOption
         The instrument associated with the order book.
 
@@ -51,111 +54,81 @@ def compute_effective_deltas(
     """
     deltas: list[OrderBookDelta] = []
     instrument_id = instrument.id
-    assert instrument_id == book_old.instrument_id
-    assert instrument_id == book_new.instrument_id
-    ts_event = book_new.ts_event
-    ts_init = book_new.ts_init
+    assert instrument_id == book.instrument_id
+    ts_event = book.ts_event
+    ts_init = book.ts_init
+    make_qty = instrument.make_qty
+
+    for bid in book.bids():
+        # Compare raw double sizes (both sides already quantized on book entry)
+        # so Quantity objects are only created for levels producing a delta
+        size_raw = bid.size()
+        old_size = old_bids.pop(bid.price, None)
+
+        if old_size is None:
+            # New bid (ADD)
+            action = BookAction.ADD
+        elif old_size != size_raw:
+            # Updated bid (UPDATE)
+            action = BookAction.UPDATE
+        else:
+            continue  # Level unchanged
 
-    old_bids: dict[Price, BookLevel] = {level.price: level for level in book_old.bids()}
-    old_asks: dict[Price, BookLevel] = {level.price: level for level in book_old.asks()}
+        order = BookOrder(
+            side=OrderSide.BUY,
+            price=bid.price,
+            size=make_qty(size_raw),
+            order_id=0,  # Not applicable for L2 data
+        )
+        deltas.append(
+            OrderBookDelta(
+                instrument_id=instrument_id,
+                action=action,
+                order=order,
+                flags=0,
+                sequence=0,
+                ts_event=ts_event,
+                ts_init=ts_init,
+            ),
+        )
 
-    new_bids = book_new.bids()
-    for bid in new_bids:
-        price = bid.price
-        size = instrument.make_qty(bid.size())
+    for ask in book.asks():
+        size_raw = ask.size()
+        old_size = old_asks.pop(ask.price, None)
 
-        if bid.price not in old_bids:
-            # New bid (ADD)
-            order = BookOrder(
-                side=OrderSide.BUY,
-                price=price,
-                size=size,
-                order_id=0,  # Not applicable for L2 data
-            )
-            deltas.append(
-                OrderBookDelta(
-                    instrument_id=instrument_id,
-                    action=BookAction.ADD,
-                    order=order,
-                    flags=0,
-                    sequence=0,
-                    ts_event=ts_event,
-                    ts_init=ts_init,
-                ),
-            )
-        elif instrument.make_qty(old_bids[bid.price].size()) != size:
-            # Updated bid (UPDATE)
-            order = BookOrder(
-                side=OrderSide.BUY,
-                price=price,
-                size=size,
-                order_id=0,  # Not applicable for L2 data
-            )
-            deltas.append(
-                OrderBookDelta(
-                    instrument_id=instrument_id,
-                    action=BookAction.UPDATE,
-                    order=order,
-                    flags=0,
-                    sequence=0,
-                    ts_event=ts_event,
-                    ts_init=ts_init,
-                ),
-            )
-
-        old_bids.pop(bid.price, None)
-
-    new_asks = book_new.asks()
-    for ask in new_asks:
-        price = ask.price
-        size = instrument.make_qty(ask.size())
-
-        if ask.price not in old_asks:
+        if old_size is None:
             # New ask (ADD)
-            order = BookOrder(
-                side=OrderSide.SELL,
-                price=price,
-                size=size,
-                order_id=0,  # Not applicable for L2 data
-            )
-            deltas.append(
-                OrderBookDelta(
-                    instrument_id=instrument_id,
-                    action=BookAction.ADD,
-                    order=order,
-                    flags=0,
-                    sequence=0,
-                    ts_event=ts_event,
-                    ts_init=ts_init,
-                ),
-            )
-        elif instrument.make_qty(old_asks[ask.price].size()) != size:
+            action = BookAction.ADD
+        elif old_size != size_raw:
             # Updated ask (UPDATE)
-            order = BookOrder(
-                side=OrderSide.SELL,
-                price=price,
-                size=size,
-                order_id=0,  # Not applicable for L2 data
-            )
-            deltas.append(
-                OrderBookDelta(
-                    instrument_id=instrument_id,
-                    action=BookAction.UPDATE,
-                    order=order,
-                    flags=0,
-                    sequence=0,
-                    ts_event=ts_event,
-                    ts_init=ts_init,
-                ),
-            )
-        old_asks.pop(ask.price, None)
+            action = BookAction.UPDATE
+        else:
+            continue  # Level unchanged
+
+        order = BookOrder(
+            side=OrderSide.SELL,
+            price=ask.price,
+            size=make_qty(size_raw),
+            order_id=0,  # Not applicable for L2 data
+        )
+        deltas.append(
+            OrderBookDelta(
+                instrument_id=instrument_id,
+                action=action,
+                order=order,
+                flags=0,
+                sequence=0,
+                ts_event=ts_event,
+                ts_init=ts_init,
+            ),
+        )
 
     # Process remaining old bids as removals
-    for old_price, old_level in old_bids.items():
+    for old_price, old_size in old_bids.items():
         order = BookOrder(
             side=OrderSide.BUY,
             price=old_price,
-            size=instrument.make_qty(old_level.size()),
+            size=make_qty(old_size),
             order_id=0,  # Not applicable for L2 data
         )
         deltas.append(
@@ -171,11 +144,11 @@ def compute_effective_deltas(
         )
 
     # Process remaining old asks as removals
-    for old_price, old_level in old_asks.items():
+    for old_price, old_size in old_asks.items():
         order = BookOrder(
             side=OrderSide.SELL,
             price=old_price,
-            size=instrument.make_qty(old_level.size()),
+            size=make_qty(old_size),
             order_id=0,  # Not applicable for L2 data
         )
         deltas.append(
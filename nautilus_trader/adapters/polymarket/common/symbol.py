@@ -13,10 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from functools import lru_cache
+
 from nautilus_trader.adapters.polymarket.common.constants import POLYMARKET_VENUE
 from nautilus_trader.model.identifiers import InstrumentId
 
 
+@lru_cache(maxsize=4096)
 def get_polymarket_instrument_id(condition_id: str, token_id: str | int) -> InstrumentId:
     return InstrumentId.from_str(f"{condition_id}-{token_id}.{POLYMARKET_VENUE}")
 
@@ -13,12 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from __future__ import annotations
+
 import asyncio
+from collections.abc import Callable
 from collections.abc import Coroutine
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import msgspec
-import pandas as pd
 from py_clob_client.client import ClobClient
 
 from nautilus_trader.adapters.polymarket.common.constants import POLYMARKET_VENUE
@@ -37,6 +39,7 @@ from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import MessageBus
 from nautilus_trader.common.enums import LogColor
+from nautilus_trader.core.data import Data
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.model.book import OrderBook
@@ -50,6 +53,16 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import BinaryOption
 
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+
 class PolymarketDataClient(LiveMarketDataClient):
     """
     Provides a data client for Polymarket, a decentralized predication market.
@@ -102,6 +115,12 @@ class PolymarketDataClient(LiveMarketDataClient):
         self._log.info(f"{config.update_instruments_interval_mins=}", LogColor.BLUE)
         self._log.info(f"{config.compute_effective_deltas=}", LogColor.BLUE)
 
+        if uvloop is not None and not type(loop).__module__.startswith("uvloop"):
+            self._log.warning(
+                f"Event loop is {type(loop).__name__} rather than uvloop: "
+                "expect reduced websocket throughput",
+            )
+
         # HTTP API
         self._http_client = http_client
 
@@ -109,17 +128,33 @@ class PolymarketDataClient(LiveMarketDataClient):
         self._ws_base_url = self._config.base_url_ws
         self._ws_client: PolymarketWebSocketClient = self._create_websocket_client()
         self._ws_clients: dict[InstrumentId, PolymarketWebSocketClient] = {}
+        self._ws_in_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=4096)
         self._decoder_market_msg = msgspec.json.Decoder(MARKET_WS_MESSAGE)
 
+        # Hot path bindings (avoid repeated attribute lookups per message)
+        self._decode_market_msg = self._decoder_market_msg.decode
+        self._instrument_for = self._cache.instrument
+        self._timestamp_ns = self._clock.timestamp_ns
+
+        # Message type dispatch (single dict lookup per message)
+        self._msg_handlers: dict[type, Callable[..., None]] = {
+            PolymarketBookSnapshot: self._handle_book_snapshot,
+            PolymarketQuotes: self._handle_quote,
+            PolymarketTrade: self._handle_trade,
+        }
+
         # Tasks
         self._update_instruments_interval_mins: int | None = config.update_instruments_interval_mins
         self._update_instruments_task: asyncio.Task | None = None
         self._main_ws_connect_task: asyncio.Task | None = None
+        self._process_ws_messages_task: asyncio.Task | None = None
         self._main_ws_delay = True
 
         # Hot caches
         self._last_quotes: dict[InstrumentId, QuoteTick] = {}
         self._local_books: dict[InstrumentId, OrderBook] = {}
+        self._subscribed_quotes: set[InstrumentId] = set()
+        self._subscribed_deltas: set[InstrumentId] = set()
 
     async def _connect(self) -> None:
         self._log.info("Initializing instruments...")
@@ -131,6 +166,7 @@ class PolymarketDataClient(LiveMarketDataClient):
                 self._update_instruments(self._update_instruments_interval_mins),
             )
 
+        self._process_ws_messages_task = self.create_task(self._process_ws_messages())
         self._main_ws_connect_task = self.create_task(self._connect_main_ws_after_delay())
 
     async def _disconnect(self) -> None:
@@ -144,18 +180,26 @@ class PolymarketDataClient(LiveMarketDataClient):
             self._main_ws_connect_task.cancel()
             self._main_ws_connect_task = None
 
+        if self._process_ws_messages_task:
+            self._log.debug("Canceling task 'process_ws_messages'")
+            self._process_ws_messages_task.cancel()
+            self._process_ws_messages_task = None
+
         # Shutdown websockets
-        tasks: set[Coroutine[Any, Any, None]] = set()
+        tasks: list[Coroutine[Any, Any, None]] = []
 
         if self._ws_client.is_connected():
-            tasks.add(self._ws_client.disconnect())
+            tasks.append(self._ws_client.disconnect())
 
         for ws_client in self._ws_clients.values():
             if ws_client.is_connected():
-                tasks.add(ws_client.disconnect())
+                tasks.append(ws_client.disconnect())
 
         if tasks:
-            await asyncio.gather(*tasks)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self._log.error(f"Error on websocket disconnect: {result}")
 
         self._main_ws_delay = True
 
@@ -165,7 +209,7 @@ class PolymarketDataClient(LiveMarketDataClient):
             self._clock,
             base_url=self._ws_base_url,
             channel=PolymarketWebSocketChannel.MARKET,
-            handler=self._handle_ws_message,
+            handler=self._enqueue_ws_message,
             handler_reconnect=None,
             loop=self._loop,
         )
@@ -182,6 +226,31 @@ class PolymarketDataClient(LiveMarketDataClient):
 
         self._main_ws_delay = False
 
+    def _enqueue_ws_message(self, raw: bytes) -> None:
+        # Invoked by the websocket client from outside the event loop thread,
+        # so marshal onto the loop before touching the asyncio queue
+        self._loop.call_soon_threadsafe(self._put_ws_message, raw)
+
+    def _put_ws_message(self, raw: bytes) -> None:
+        try:
+            self._ws_in_queue.put_nowait(raw)
+        except asyncio.QueueFull:
+            # Drop the oldest message to keep the stream as fresh as possible
+            self._log.error(
+                f"Websocket message queue full at {self._ws_in_queue.maxsize:_}, "
+                "dropping oldest message",
+            )
+            self._ws_in_queue.get_nowait()
+            self._ws_in_queue.put_nowait(raw)
+
+    async def _process_ws_messages(self) -> None:
+        try:
+            while True:
+                raw = await self._ws_in_queue.get()
+                self._handle_ws_message(raw)
+        except asyncio.CancelledError:
+            self._log.debug("Canceled task 'process_ws_messages'")
+
     def _send_all_instruments_to_data_engine(self) -> None:
         for instrument in self._instrument_provider.get_all().values():
             self._handle_data(instrument)
@@ -201,7 +270,7 @@ class PolymarketDataClient(LiveMarketDataClient):
         except asyncio.CancelledError:
             self._log.debug("Canceled task 'update_instruments'")
 
-    async def _subscribe_asset_book(self, instrument_id):
+    async def _subscribe_asset_book(self, instrument_id: InstrumentId) -> None:
         token_id = get_polymarket_token_id(instrument_id)
 
         if not self._ws_client.is_connected():
@@ -235,9 +304,12 @@ class PolymarketDataClient(LiveMarketDataClient):
             return
 
         if self._config.compute_effective_deltas:
-            local_book = OrderBook(instrument_id, book_type=BookType.L2_MBP)
-            self._local_books[instrument_id] = local_book
+            # Drop any retained book so the first snapshot after (re)subscribing
+            # passes through in full rather than diffing against stale state;
+            # _handle_deltas creates the book lazily and maintains it in place
+            self._local_books.pop(instrument_id, None)
 
+        self._subscribed_deltas.add(instrument_id)
         await self._subscribe_asset_book(instrument_id)
 
     async def _subscribe_quote_ticks(
@@ -245,6 +317,7 @@ class PolymarketDataClient(LiveMarketDataClient):
         instrument_id: InstrumentId,
         params: dict[str, Any] | None = None,
     ) -> None:
+        self._subscribed_quotes.add(instrument_id)
         await self._subscribe_asset_book(instrument_id)
 
     async def _subscribe_trade_ticks(
@@ -268,6 +341,7 @@ class PolymarketDataClient(LiveMarketDataClient):
         instrument_id: InstrumentId,
         params: dict[str, Any] | None = None,
     ) -> None:
+        self._subscribed_deltas.discard(instrument_id)
         self._log.error(
             f"Cannot unsubscribe from {instrument_id} order book deltas: unsubscribing not supported by Polymarket",
         )
@@ -286,6 +360,7 @@ class PolymarketDataClient(LiveMarketDataClient):
         instrument_id: InstrumentId,
         params: dict[str, Any] | None = None,
     ) -> None:
+        self._subscribed_quotes.discard(instrument_id)
         self._log.error(
             f"Cannot unsubscribe from {instrument_id} quotes: unsubscribing not supported by Polymarket",
         )
@@ -312,8 +387,8 @@ class PolymarketDataClient(LiveMarketDataClient):
         self,
         instrument_id: InstrumentId,
         correlation_id: UUID4,
-        start: pd.Timestamp | None = None,
-        end: pd.Timestamp | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
         params: dict[str, Any] | None = None,
     ) -> None:
         if start is not None:
@@ -337,8 +412,8 @@ class PolymarketDataClient(LiveMarketDataClient):
         self,
         venue: Venue,
         correlation_id: UUID4,
-        start: pd.Timestamp | None = None,
-        end: pd.Timestamp | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
         params: dict[str, Any] | None = None,
     ) -> None:
         if start is not None:
@@ -352,11 +427,9 @@ class PolymarketDataClient(LiveMarketDataClient):
             )
 
         all_instruments = self._instrument_provider.get_all()
-        target_instruments = []
-        for instrument in all_instruments.values():
-            if instrument.venue == venue:
-                target_instruments.append(instrument)
-
+        target_instruments = [
+            instrument for instrument in all_instruments.values() if instrument.venue == venue
+        ]
         self._handle_instruments(target_instruments, venue, correlation_id, params)
 
     async def _request_quote_ticks(
@@ -364,8 +437,8 @@ class PolymarketDataClient(LiveMarketDataClient):
         instrument_id: InstrumentId,
         limit: int,
         correlation_id: UUID4,
-        start: pd.Timestamp | None = None,
-        end: pd.Timestamp | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
         params: dict[str, Any] | None = None,
     ) -> None:
         self._log.error("Cannot request historical quotes: not published by Polymarket")
@@ -375,8 +448,8 @@ class PolymarketDataClient(LiveMarketDataClient):
         instrument_id: InstrumentId,
         limit: int,
         correlation_id: UUID4,
-        start: pd.Timestamp | None = None,
-        end: pd.Timestamp | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
         params: dict[str, Any] | None = None,
     ) -> None:
         self._log.error("Cannot request historical trades: not published by Polymarket")
@@ -386,8 +459,8 @@ class PolymarketDataClient(LiveMarketDataClient):
         bar_type: BarType,
         limit: int,
         correlation_id: UUID4,
-        start: pd.Timestamp | None = None,
-        end: pd.Timestamp | None = None,
+        start: pd.Timestamp | int | None = None,
+        end: pd.Timestamp | int | None = None,
         params: dict[str, Any] | None = None,
     ) -> None:
         self._log.error("Cannot request historical bars: not published by Polymarket")
@@ -395,94 +468,120 @@ class PolymarketDataClient(LiveMarketDataClient):
     def _handle_ws_message(self, raw: bytes) -> None:
         # Uncomment for development
         # self._log.info(str(raw), LogColor.MAGENTA)
+        instrument_for = self._instrument_for
+        msg_handlers = self._msg_handlers
+        out: list[Data] = []
         try:
-            ws_message = self._decoder_market_msg.decode(raw)
+            ws_message = self._decode_market_msg(raw)
             for msg in ws_message:
-                if isinstance(msg, list):
-                    if isinstance(msg, PolymarketBookSnapshot):
-                        instrument_id = get_polymarket_instrument_id(msg.market, msg.asset_id)
-                        instrument = self._cache.instrument(instrument_id)
-                        if instrument is None:
-                            self._log.error(f"Cannot find instrument for {instrument_id}")
-                            return
-                        self._handle_book_snapshot(instrument=instrument, ws_message=msg)
-                else:
-                    instrument_id = get_polymarket_instrument_id(msg.market, msg.asset_id)
-                    instrument = self._cache.instrument(instrument_id)
-                    if instrument is None:
-                        self._log.error(f"Cannot find instrument for {instrument_id}")
-                        return
-
-                    if isinstance(msg, PolymarketBookSnapshot):
-                        self._handle_book_snapshot(instrument=instrument, ws_message=msg)
-                    elif isinstance(msg, PolymarketQuotes):
-                        self._handle_quote(instrument=instrument, ws_message=msg)
-                    elif isinstance(msg, PolymarketTrade):
-                        self._handle_trade(instrument=instrument, ws_message=msg)
-                    else:
-                        self._log.error(f"Unknown websocket message topic: {ws_message}")
+                if type(msg) is list:
+                    # Initial book snapshots can arrive batched in a nested list,
+                    # flatten into the iteration (appended items are picked up)
+                    ws_message.extend(msg)
+                    continue
+                instrument_id = get_polymarket_instrument_id(msg.market, msg.asset_id)
+                instrument = instrument_for(instrument_id)
+                if instrument is None:
+                    self._log.error(f"Cannot find instrument for {instrument_id}")
+                    continue
+                handler = msg_handlers.get(type(msg))
+                if handler is None:
+                    self._log.error(f"Unknown websocket message topic: {msg}")
+                    continue
+                handler(instrument=instrument, ws_message=msg, out=out)
         except Exception as e:
             self._log.error(f"Failed to parse websocket message: {raw.decode()} with error {e}")
+        finally:
+            # Always publish what was collected: the handlers may have already
+            # mutated the local books, so dropping collected items on a failure
+            # mid-frame would permanently diverge downstream state
+            if out:
+                self._handle_data_batch(out)
+
+    def _handle_data_batch(self, data_items: list[Data]) -> None:
+        handle_data = self._handle_data
+        for data in data_items:
+            handle_data(data)
 
     def _handle_book_snapshot(
         self,
         instrument: BinaryOption,
         ws_message: PolymarketBookSnapshot,
+        out: list[Data],
     ) -> None:
-        now_ns = self._clock.timestamp_ns()
-        deltas = ws_message.parse_to_snapshot(instrument=instrument, ts_init=now_ns)
+        now_ns = self._timestamp_ns()
 
-        self._handle_deltas(instrument, deltas)
+        if instrument.id in self._subscribed_deltas:
+            deltas = ws_message.parse_to_snapshot(instrument=instrument, ts_init=now_ns)
+            self._handle_deltas(instrument, deltas, out)
 
-        if instrument.id in self.subscribed_quote_ticks():
+        if instrument.id in self._subscribed_quotes:
             quote = ws_message.parse_to_quote_tick(instrument=instrument, ts_init=now_ns)
             self._last_quotes[instrument.id] = quote
-            self._handle_data(quote)
+            out.append(quote)
 
-    def _handle_deltas(self, instrument: BinaryOption, deltas: OrderBookDeltas) -> None:
+    def _handle_deltas(
+        self,
+        instrument: BinaryOption,
+        deltas: OrderBookDeltas,
+        out: list[Data],
+    ) -> None:
         if self._config.compute_effective_deltas:
             # Compute effective deltas (reduce snapshot based on old and new book states),
             # prioritizing a smaller data footprint over computational efficiency.
-            t0 = self._clock.timestamp_ns()
-            book_old = self._local_books.get(instrument.id)
-            book_new = OrderBook(instrument.id, book_type=BookType.L2_MBP)
-            book_new.apply_deltas(deltas)
-            self._local_books[instrument.id] = book_new
-            deltas = compute_effective_deltas(book_old, book_new, instrument)
-
-            interval_ms = (self._clock.timestamp_ns() - t0) / 1_000_000
+            t0 = self._timestamp_ns()
+            local_book = self._local_books.get(instrument.id)
+            if local_book is None:
+                # First snapshot for this instrument: nothing to diff against,
+                # so pass the full snapshot through unchanged
+                local_book = OrderBook(instrument.id, book_type=BookType.L2_MBP)
+                self._local_books[instrument.id] = local_book
+                local_book.apply_deltas(deltas)
+            else:
+                old_bids = {level.price: level.size() for level in local_book.bids()}
+                old_asks = {level.price: level.size() for level in local_book.asks()}
+                local_book.apply_deltas(deltas)
+                deltas = compute_effective_deltas(old_bids, old_asks, local_book, instrument)
+
+            interval_ms = (self._timestamp_ns() - t0) / 1_000_000
             self._log.debug(f"Computed effective deltas in {interval_ms:.3f}ms")
-            # self._log.warning(book_new.pprint())  # Uncomment for development
+            # self._log.warning(local_book.pprint())  # Uncomment for development
 
         # Check if any effective deltas remain
         if deltas:
-            self._handle_data(deltas)
+            out.append(deltas)
 
     def _handle_quote(
         self,
         instrument: BinaryOption,
         ws_message: PolymarketQuotes,
+        out: list[Data],
     ) -> None:
-        now_ns = self._clock.timestamp_ns()
-        deltas = ws_message.parse_to_deltas(instrument=instrument, ts_init=now_ns)
+        now_ns = self._timestamp_ns()
 
-        if self._config.compute_effective_deltas:
-            local_book = self._local_books.get(instrument.id)
-            if local_book:
-                local_book.apply_deltas(deltas)
+        if instrument.id in self._subscribed_deltas:
+            deltas = ws_message.parse_to_deltas(instrument=instrument, ts_init=now_ns)
 
-        self._handle_data(deltas)
+            if self._config.compute_effective_deltas:
+                local_book = self._local_books.get(instrument.id)
+                if local_book:
+                    local_book.apply_deltas(deltas)
 
-        if instrument.id in self.subscribed_quote_ticks():
+            out.append(deltas)
+
+        if instrument.id in self._subscribed_quotes:
             last_quote = self._last_quotes.get(instrument.id)
             if last_quote is None:
                 return
 
+            if not ws_message.affects_top(last_quote):
+                return  # No top-of-book change, skip quote materialization
+
             # Check if top-of-book change
             quotes = ws_message.parse_to_quote_ticks(
                 instrument=instrument,
                 last_quote=last_quote,
-                ts_init=self._clock.timestamp_ns(),
+                ts_init=now_ns,
             )
             for quote in quotes:
                 if (
@@ -494,13 +593,14 @@ class PolymarketDataClient(LiveMarketDataClient):
                     continue  # No top-of-book change
 
                 self._last_quotes[instrument.id] = quote
-                self._handle_data(quote)
+                out.append(quote)
 
     def _handle_trade(
         self,
         instrument: BinaryOption,
         ws_message: PolymarketTrade,
+        out: list[Data],
     ) -> None:
-        now_ns = self._clock.timestamp_ns()
+        now_ns = self._timestamp_ns()
         trade = ws_message.parse_to_trade_tick(instrument=instrument, ts_init=now_ns)
-        self._handle_data(trade)
+        out.append(trade)
@@ -50,6 +50,8 @@ class PolymarketBookSnapshot(msgspec.Struct, tag="book", tag_field="event_type",
         ts_init: int,
     ) -> OrderBookDeltas:
         ts_event = millis_to_nanos(float(self.timestamp))
+        make_price = instrument.make_price
+        make_qty = instrument.make_qty
 
         deltas: list[OrderBookDelta] = []
 
@@ -74,8 +76,8 @@ class PolymarketBookSnapshot(msgspec.Struct, tag="book", tag_field="event_type",
 
             order = BookOrder(
                 side=OrderSide.BUY,
-                price=instrument.make_price(float(bid.price)),
-                size=instrument.make_qty(float(bid.size)),
+                price=make_price(float(bid.price)),
+                size=make_qty(float(bid.size)),
                 order_id=0,  # N/A
             )
             delta = OrderBookDelta(
@@ -99,8 +101,8 @@ class PolymarketBookSnapshot(msgspec.Struct, tag="book", tag_field="event_type",
 
             order = BookOrder(
                 side=OrderSide.SELL,
-                price=instrument.make_price(float(ask.price)),
-                size=instrument.make_qty(float(ask.size)),
+                price=make_price(float(ask.price)),
+                size=make_qty(float(ask.size)),
                 order_id=0,  # N/A
             )
             delta = OrderBookDelta(
@@ -151,12 +153,16 @@ class PolymarketQuotes(msgspec.Struct, tag="price_change", tag_field="event_type
         instrument: BinaryOption,
         ts_init: int,
     ) -> OrderBookDeltas:
+        ts_event = millis_to_nanos(float(self.timestamp))
+        make_price = instrument.make_price
+        make_qty = instrument.make_qty
+
         deltas: list[OrderBookDelta] = []
         for change in self.changes:
             order = BookOrder(
                 side=OrderSide.BUY if change.side == PolymarketOrderSide.BUY else OrderSide.SELL,
-                price=instrument.make_price(float(change.price)),
-                size=instrument.make_qty(float(change.size)),
+                price=make_price(float(change.price)),
+                size=make_qty(float(change.size)),
                 order_id=0,  # N/A for L2 books
             )
             delta = OrderBookDelta(
@@ -165,29 +171,55 @@ class PolymarketQuotes(msgspec.Struct, tag="price_change", tag_field="event_type
                 order=order,
                 flags=RecordFlag.F_LAST,
                 sequence=0,  # N/A
-                ts_event=millis_to_nanos(float(self.timestamp)),
+                ts_event=ts_event,
                 ts_init=ts_init,
             )
             deltas.append(delta)
 
         return OrderBookDeltas(instrument.id, deltas)
 
+    def affects_top(self, last_quote: QuoteTick) -> bool:
+        # Cheap single scan over the raw changes to determine whether any
+        # update can move the top-of-book away from the given last quote.
+        # Raw floats are compared against the quantized top: a raw value which
+        # only quantizes onto the top differs here and yields a false positive,
+        # which is safe (the caller still applies its equality filter), while
+        # equal raw values always quantize equal, so a change which would
+        # survive the caller's filter can never be reported as False here
+        bid_px = last_quote.bid_price.as_double()
+        bid_sz = last_quote.bid_size.as_double()
+        ask_px = last_quote.ask_price.as_double()
+        ask_sz = last_quote.ask_size.as_double()
+
+        for change in self.changes:
+            if change.side == PolymarketOrderSide.BUY:
+                if float(change.price) != bid_px or float(change.size) != bid_sz:
+                    return True
+            elif float(change.price) != ask_px or float(change.size) != ask_sz:
+                return True
+
+        return False
+
     def parse_to_quote_ticks(
         self,
         instrument: BinaryOption,
         last_quote: QuoteTick,
         ts_init: int,
     ) -> list[QuoteTick]:
+        ts_event = millis_to_nanos(float(self.timestamp))
+        make_price = instrument.make_price
+        make_qty = instrument.make_qty
+
         quotes: list[QuoteTick] = []
         for change in self.changes:
             if change.side == PolymarketOrderSide.BUY:
                 ask_price = last_quote.ask_price
                 ask_size = last_quote.ask_size
-                bid_price = instrument.make_price(float(change.price))
-                bid_size = instrument.make_qty(float(change.size))
+                bid_price = make_price(float(change.price))
+                bid_size = make_qty(float(change.size))
             else:  # SELL
-                ask_price = instrument.make_price(float(change.price))
-                ask_size = instrument.make_qty(float(change.size))
+                ask_price = make_price(float(change.price))
+                ask_size = make_qty(float(change.size))
                 bid_price = last_quote.bid_price
                 bid_size = last_quote.bid_size
             quote = QuoteTick(
@@ -196,7 +228,7 @@ class PolymarketQuotes(msgspec.Struct, tag="price_change", tag_field="event_type
                 ask_price=ask_price,
                 bid_size=bid_size,
                 ask_size=ask_size,
-                ts_event=millis_to_nanos(float(self.timestamp)),
+                ts_event=ts_event,
                 ts_init=ts_init,
             )
             quotes.append(quote)
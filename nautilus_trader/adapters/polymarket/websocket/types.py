@@ -22,6 +22,8 @@ from nautilus_trader.adapters.polymarket.schemas.user import PolymarketUserOrder
 from nautilus_trader.adapters.polymarket.schemas.user import PolymarketUserTrade
 
 
+# All union variants are msgspec structs tagged on the `event_type` field,
+# so the decoder discriminates by tag rather than trial decoding each variant
 MARKET_WS_MESSAGE: Final = list[
     list[PolymarketBookSnapshot] | PolymarketBookSnapshot | PolymarketQuotes | PolymarketTrade
 ]
@@ -0,0 +1,170 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.adapters.polymarket.common.deltas import compute_effective_deltas
+from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.instruments import BinaryOption
+from nautilus_trader.model.objects import Price
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+def _delta(
+    instrument: BinaryOption,
+    action: BookAction,
+    side: OrderSide,
+    price: float,
+    size: float,
+) -> OrderBookDelta:
+    order = BookOrder(
+        side=side,
+        price=instrument.make_price(price),
+        size=instrument.make_qty(size),
+        order_id=0,
+    )
+    return OrderBookDelta(
+        instrument_id=instrument.id,
+        action=action,
+        order=order,
+        flags=0,
+        sequence=0,
+        ts_event=0,
+        ts_init=0,
+    )
+
+
+def _make_book(instrument: BinaryOption) -> OrderBook:
+    book = OrderBook(instrument.id, book_type=BookType.L2_MBP)
+    deltas = [
+        _delta(instrument, BookAction.ADD, OrderSide.BUY, 0.510, 100.0),
+        _delta(instrument, BookAction.ADD, OrderSide.BUY, 0.500, 50.0),
+        _delta(instrument, BookAction.ADD, OrderSide.SELL, 0.520, 80.0),
+        _delta(instrument, BookAction.ADD, OrderSide.SELL, 0.530, 60.0),
+    ]
+    book.apply_deltas(OrderBookDeltas(instrument_id=instrument.id, deltas=deltas))
+    return book
+
+
+def _snapshot_levels(book: OrderBook) -> tuple[dict[Price, float], dict[Price, float]]:
+    old_bids = {level.price: level.size() for level in book.bids()}
+    old_asks = {level.price: level.size() for level in book.asks()}
+    return old_bids, old_asks
+
+
+def test_compute_effective_deltas_returns_none_when_unchanged() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    book = _make_book(instrument)
+    old_bids, old_asks = _snapshot_levels(book)
+
+    # Act
+    result = compute_effective_deltas(old_bids, old_asks, book, instrument)
+
+    # Assert
+    assert result is None
+
+
+def test_compute_effective_deltas_new_level() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    book = _make_book(instrument)
+    old_bids, old_asks = _snapshot_levels(book)
+
+    update = _delta(instrument, BookAction.ADD, OrderSide.BUY, 0.505, 25.0)
+    book.apply_deltas(OrderBookDeltas(instrument_id=instrument.id, deltas=[update]))
+
+    # Act
+    result = compute_effective_deltas(old_bids, old_asks, book, instrument)
+
+    # Assert
+    assert result is not None
+    assert len(result.deltas) == 1
+    assert result.deltas[0].action == BookAction.ADD
+    assert result.deltas[0].order.side == OrderSide.BUY
+    assert result.deltas[0].order.price == instrument.make_price(0.505)
+    assert result.deltas[0].order.size == instrument.make_qty(25.0)
+    assert result.deltas[0].flags == RecordFlag.F_LAST
+
+
+def test_compute_effective_deltas_updated_level() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    book = _make_book(instrument)
+    old_bids, old_asks = _snapshot_levels(book)
+
+    update = _delta(instrument, BookAction.UPDATE, OrderSide.SELL, 0.520, 95.0)
+    book.apply_deltas(OrderBookDeltas(instrument_id=instrument.id, deltas=[update]))
+
+    # Act
+    result = compute_effective_deltas(old_bids, old_asks, book, instrument)
+
+    # Assert
+    assert result is not None
+    assert len(result.deltas) == 1
+    assert result.deltas[0].action == BookAction.UPDATE
+    assert result.deltas[0].order.side == OrderSide.SELL
+    assert result.deltas[0].order.price == instrument.make_price(0.520)
+    assert result.deltas[0].order.size == instrument.make_qty(95.0)
+    assert result.deltas[0].flags == RecordFlag.F_LAST
+
+
+def test_compute_effective_deltas_removed_level() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    book = _make_book(instrument)
+    old_bids, old_asks = _snapshot_levels(book)
+
+    update = _delta(instrument, BookAction.DELETE, OrderSide.BUY, 0.500, 0.0)
+    book.apply_deltas(OrderBookDeltas(instrument_id=instrument.id, deltas=[update]))
+
+    # Act
+    result = compute_effective_deltas(old_bids, old_asks, book, instrument)
+
+    # Assert
+    assert result is not None
+    assert len(result.deltas) == 1
+    assert result.deltas[0].action == BookAction.DELETE
+    assert result.deltas[0].order.side == OrderSide.BUY
+    assert result.deltas[0].order.price == instrument.make_price(0.500)
+    assert result.deltas[0].order.size == instrument.make_qty(50.0)
+    assert result.deltas[0].flags == RecordFlag.F_LAST
+
+
+def test_compute_effective_deltas_marks_only_last_delta() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    book = _make_book(instrument)
+    old_bids, old_asks = _snapshot_levels(book)
+
+    updates = [
+        _delta(instrument, BookAction.UPDATE, OrderSide.BUY, 0.510, 150.0),
+        _delta(instrument, BookAction.DELETE, OrderSide.SELL, 0.530, 0.0),
+    ]
+    book.apply_deltas(OrderBookDeltas(instrument_id=instrument.id, deltas=updates))
+
+    # Act
+    result = compute_effective_deltas(old_bids, old_asks, book, instrument)
+
+    # Assert
+    assert result is not None
+    assert len(result.deltas) == 2
+    assert result.deltas[0].flags == 0
+    assert result.deltas[-1].flags == RecordFlag.F_LAST
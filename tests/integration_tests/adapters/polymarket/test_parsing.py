@@ -18,8 +18,10 @@ import pkgutil
 import msgspec
 import pytest
 
+from nautilus_trader.adapters.polymarket.common.enums import PolymarketOrderSide
 from nautilus_trader.adapters.polymarket.common.parsing import parse_instrument
 from nautilus_trader.adapters.polymarket.schemas.book import PolymarketBookSnapshot
+from nautilus_trader.adapters.polymarket.schemas.book import PolymarketQuote
 from nautilus_trader.adapters.polymarket.schemas.book import PolymarketQuotes
 from nautilus_trader.adapters.polymarket.schemas.book import PolymarketTrade
 from nautilus_trader.adapters.polymarket.schemas.user import PolymarketUserOrder
@@ -139,6 +141,107 @@ def test_parse_quote_ticks() -> None:
     assert quotes[0].ts_init == 2
 
 
+def _price_change(changes: list[PolymarketQuote]) -> PolymarketQuotes:
+    return PolymarketQuotes(
+        market="0x12a0cb60174abc437bf1178367c72d11f069e1a3add20b148fb0ab4279b772b2",
+        asset_id="92544998123698303655208967887569360731013655782348975589292031774495159624905",
+        changes=changes,
+        timestamp="1729084877448",
+    )
+
+
+def test_affects_top_returns_false_when_changes_match_top() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    last_quote = TestDataStubs.quote_tick(
+        instrument=instrument,
+        bid_price=0.513,
+        ask_price=0.515,
+        bid_size=100.0,
+        ask_size=200.0,
+    )
+    ws_message = _price_change(
+        [
+            PolymarketQuote(price="0.513", side=PolymarketOrderSide.BUY, size="100"),
+            PolymarketQuote(price="0.515", side=PolymarketOrderSide.SELL, size="200"),
+        ],
+    )
+
+    # Act, Assert
+    assert not ws_message.affects_top(last_quote)
+
+
+def test_affects_top_returns_true_on_top_size_change() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    last_quote = TestDataStubs.quote_tick(
+        instrument=instrument,
+        bid_price=0.513,
+        ask_price=0.515,
+        bid_size=100.0,
+        ask_size=200.0,
+    )
+    ws_message = _price_change(
+        [PolymarketQuote(price="0.513", side=PolymarketOrderSide.BUY, size="150")],
+    )
+
+    # Act, Assert
+    assert ws_message.affects_top(last_quote)
+
+
+def test_affects_top_returns_true_on_new_price() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    last_quote = TestDataStubs.quote_tick(
+        instrument=instrument,
+        bid_price=0.513,
+        ask_price=0.515,
+        bid_size=100.0,
+        ask_size=200.0,
+    )
+    ws_message = _price_change(
+        [PolymarketQuote(price="0.514", side=PolymarketOrderSide.SELL, size="50")],
+    )
+
+    # Act, Assert
+    assert ws_message.affects_top(last_quote)
+
+
+def test_affects_top_true_when_raw_price_quantizes_to_top() -> None:
+    # A raw price which only quantizes onto the current top must still report
+    # a possible change (safe false positive): the downstream equality filter
+    # drops the quote, but the cheap raw comparison must never report False
+    # for a change that could survive quantization
+
+    # Arrange
+    instrument = TestInstrumentProvider.binary_option()
+    last_quote = TestDataStubs.quote_tick(
+        instrument=instrument,
+        bid_price=0.513,
+        ask_price=0.515,
+        bid_size=100.0,
+        ask_size=200.0,
+    )
+    ws_message = _price_change(
+        [PolymarketQuote(price="0.5131", side=PolymarketOrderSide.BUY, size="100")],
+    )
+
+    # Act
+    affects = ws_message.affects_top(last_quote)
+    quotes = ws_message.parse_to_quote_ticks(
+        instrument=instrument,
+        last_quote=last_quote,
+        ts_init=2,
+    )
+
+    # Assert
+    assert affects
+    assert quotes[0].bid_price == last_quote.bid_price  # Quantizes onto the top
+    assert quotes[0].ask_price == last_quote.ask_price
+    assert quotes[0].bid_size == last_quote.bid_size
+    assert quotes[0].ask_size == last_quote.ask_size
+
+
 def test_parse_trade_tick() -> None:
     # Arrange
     data = pkgutil.get_data(